@@ -58,6 +58,11 @@ class OHEChoice(AutoSklearnChoice):
 
         if default is None:
             defaults = ['one_hot_encoding', 'no_encoding']
+            if dataset_properties.get('sparse'):
+                # A sparse pipeline wants CSR output anyway, so prefer the
+                # encoder that assembles it directly without a dense
+                # indicator intermediate.
+                defaults.insert(0, 'fast_one_hot_encoding')
             for default_ in defaults:
                 if default_ in available_preprocessors:
                     default = default_
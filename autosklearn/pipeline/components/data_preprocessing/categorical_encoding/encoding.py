@@ -2,12 +2,12 @@ from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 
+import pandas as pd
+
 from ConfigSpace.configuration_space import ConfigurationSpace
 
 import scipy.sparse
 
-from sklearn.preprocessing import OrdinalEncoder
-
 from autosklearn.pipeline.base import DATASET_PROPERTIES_TYPE, PIPELINE_DATA_DTYPE
 from autosklearn.pipeline.components.base import AutoSklearnPreprocessingAlgorithm
 from autosklearn.pipeline.constants import DENSE, SPARSE, UNSIGNED_DATA, INPUT
@@ -22,10 +22,17 @@ class OrdinalEncoding(AutoSklearnPreprocessingAlgorithm):
     def fit(self, X: PIPELINE_DATA_DTYPE,
             y: Optional[PIPELINE_DATA_DTYPE] = None) -> 'OrdinalEncoding':
         if not scipy.sparse.issparse(X):
-            self.preprocessor = OrdinalEncoder(
-                categories='auto', handle_unknown='use_encoded_value', unknown_value=-1,
-            )
-            self.preprocessor.fit(X, y)
+            if hasattr(X, 'iloc'):
+                X = X.to_numpy()
+            # pd.factorize builds the category dictionary with a single
+            # hash-table pass per column, which is considerably cheaper than
+            # the sort-based fit of sklearn's OrdinalEncoder; sort=True keeps
+            # the same code order.
+            self.categories_ = [
+                np.asarray(pd.factorize(X[:, column], sort=True)[1])
+                for column in range(X.shape[1])
+            ]
+            self.preprocessor = self
         return self
 
     def transform(self, X: PIPELINE_DATA_DTYPE) -> PIPELINE_DATA_DTYPE:
@@ -35,11 +42,20 @@ class OrdinalEncoding(AutoSklearnPreprocessingAlgorithm):
             return X
         if self.preprocessor is None:
             raise NotImplementedError()
+        if hasattr(X, 'iloc'):
+            X = X.to_numpy()
+        Xt = np.empty(X.shape, dtype=np.int32)
+        for column, categories in enumerate(self.categories_):
+            # The stored categories make this a pure hash-table lookup;
+            # unseen categories get code -1.
+            Xt[:, column] = pd.Categorical(
+                X[:, column], categories=categories).codes
         # Notice we are shifting the unseen categories during fit to 1
         # from -1, 0, ... to 0,..., cat + 1
         # This is done because Category shift requires non negative integers
         # Consider removing this if that step is removed
-        return self.preprocessor.transform(X) + 1
+        Xt += 1
+        return Xt
 
     @staticmethod
     def get_properties(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
@@ -0,0 +1,134 @@
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple, Union
+
+from ConfigSpace.configuration_space import ConfigurationSpace
+
+import scipy.sparse
+
+import numpy as np
+
+from autosklearn.pipeline.base import DATASET_PROPERTIES_TYPE, PIPELINE_DATA_DTYPE
+from autosklearn.pipeline.implementations.SparseOneHotEncoder import SparseOneHotEncoder
+from autosklearn.pipeline.components.base import AutoSklearnPreprocessingAlgorithm
+from autosklearn.pipeline.constants import DENSE, SPARSE, UNSIGNED_DATA
+
+# The indptr of the output only depends on the input shape and is identical
+# across the thousands of trials evaluated on the same fold, so it is built
+# once per observed shape. The cached arrays are shared between output
+# matrices and therefore marked read-only.
+_indptr_cache: 'OrderedDict' = OrderedDict()
+_INDPTR_CACHE_SIZE = 16
+
+
+def _shared_indptr(n_samples: int, n_features: int) -> np.ndarray:
+    key = (n_samples, n_features)
+    indptr = _indptr_cache.get(key)
+    if indptr is None:
+        indptr = np.arange(0, n_samples * n_features + 1, n_features,
+                           dtype=np.int32)
+        indptr.flags.writeable = False
+        _indptr_cache[key] = indptr
+        while len(_indptr_cache) > _INDPTR_CACHE_SIZE:
+            _indptr_cache.popitem(last=False)
+    else:
+        _indptr_cache.move_to_end(key)
+    return indptr
+
+
+class FastOneHotEncoder(AutoSklearnPreprocessingAlgorithm):
+    """ One hot encoder that builds its CSR output directly from the codes.
+
+    For dense integer codes the indicator matrix is assembled from raveled
+    index arithmetic alone - every cell contributes exactly one entry, so the
+    indptr is a plain arange and no dense indicator matrix is ever allocated.
+    Codes unseen during fit are dropped, matching handle_unknown='ignore' of
+    the sklearn encoder. Sparse inputs are delegated to the
+    SparseOneHotEncoder, whose stored entries do not have one code per cell.
+
+    Output matrices in which no entry was dropped share a cached, read-only
+    indptr array with other matrices of the same shape. Callers that rewrite
+    the index structure of the result in place (eliminate_zeros,
+    sum_duplicates, in-place sorting) must copy the indptr first.
+    """
+
+    def __init__(self, random_state: Optional[np.random.RandomState] = None):
+        self.random_state = random_state
+
+    def fit(self, X: PIPELINE_DATA_DTYPE, y: Optional[PIPELINE_DATA_DTYPE] = None
+            ) -> 'FastOneHotEncoder':
+        if scipy.sparse.issparse(X):
+            self.preprocessor = SparseOneHotEncoder()
+            self.preprocessor.fit(X)
+            return self
+        X = np.asarray(X)
+        if X.min() < 0:
+            raise ValueError("X needs to contain only non-negative integers.")
+        n_values = X.max(axis=0).astype(np.int64) + 1
+        offsets = np.concatenate([[0], np.cumsum(n_values)])
+        self.n_values_ = n_values
+        self.offsets_ = offsets[:-1]
+        # Columns of the full indicator matrix that actually occur in the
+        # data; the rest (e.g. the reserved codes 0-2) are compacted away,
+        # as the sklearn encoders do with their fitted categories.
+        self.active_features_ = np.unique(
+            (X + self.offsets_[np.newaxis, :]).ravel())
+        self.preprocessor = self
+        return self
+
+    def transform(self, X: PIPELINE_DATA_DTYPE) -> PIPELINE_DATA_DTYPE:
+        if self.preprocessor is None:
+            raise NotImplementedError()
+        if scipy.sparse.issparse(X):
+            return self.preprocessor.transform(X)
+        X = np.asarray(X)
+        n_samples, n_features = X.shape
+        if n_features != self.offsets_.shape[0]:
+            raise ValueError("X has different shape than during fitting."
+                             " Expected %d, got %d."
+                             % (self.offsets_.shape[0], n_features))
+        full = (X + self.offsets_[np.newaxis, :]).ravel()
+        indices = np.searchsorted(self.active_features_, full)
+        np.clip(indices, 0, self.active_features_.shape[0] - 1, out=indices)
+        # Entries whose code was not active during fit get a zero payload and
+        # are removed below, i.e. unknown categories are ignored. Codes
+        # outside the fitted range of their own column would alias into a
+        # neighbouring column's offset range and could match one of its
+        # active features, so they are masked out explicitly.
+        data = self.active_features_[indices] == full
+        data &= ((X >= 0) & (X < self.n_values_[np.newaxis, :])).ravel()
+        data = data.astype(np.int8)
+        if data.all():
+            # The common case: nothing to drop, so the matrix can share the
+            # cached read-only indptr for this shape.
+            indptr = _shared_indptr(n_samples, n_features)
+        else:
+            # eliminate_zeros rewrites the indptr in place, so dropping
+            # unknown entries needs a private copy.
+            indptr = np.arange(0, n_samples * n_features + 1, n_features,
+                               dtype=np.int32)
+        out = scipy.sparse.csr_matrix(
+            (data, indices.astype(np.int32), indptr),
+            shape=(n_samples, self.active_features_.shape[0]))
+        if indptr.flags.writeable:
+            out.eliminate_zeros()
+        return out
+
+    @staticmethod
+    def get_properties(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
+                       ) -> Dict[str, Optional[Union[str, int, bool, Tuple]]]:
+        return {'shortname': 'Fast1Hot',
+                'name': 'Fast One Hot Encoder',
+                'handles_regression': True,
+                'handles_classification': True,
+                'handles_multiclass': True,
+                'handles_multilabel': True,
+                'handles_multioutput': True,
+                'handles_sparse': True,
+                'handles_dense': True,
+                'input': (DENSE, SPARSE, UNSIGNED_DATA),
+                'output': (SPARSE, UNSIGNED_DATA), }
+
+    @staticmethod
+    def get_hyperparameter_search_space(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
+                                        ) -> ConfigurationSpace:
+        return ConfigurationSpace()
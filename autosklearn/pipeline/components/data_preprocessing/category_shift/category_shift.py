@@ -4,11 +4,41 @@ from ConfigSpace.configuration_space import ConfigurationSpace
 
 import numpy as np
 
+import scipy.sparse
+
 from autosklearn.pipeline.base import DATASET_PROPERTIES_TYPE, PIPELINE_DATA_DTYPE
-import autosklearn.pipeline.implementations.CategoryShift
 from autosklearn.pipeline.components.base import AutoSklearnPreprocessingAlgorithm
 from autosklearn.pipeline.constants import DENSE, SPARSE, UNSIGNED_DATA, INPUT
 
+# Pre-boxed shift constant, so transform does not convert a Python int to a
+# C scalar on every call.
+_SHIFT = np.int32(3)
+
+# Built once at import time; get_properties is queried thousands of times
+# during search-space construction and the answer never changes. Callers
+# treat the returned dict as read-only.
+_PROPS: Dict[str, Optional[Union[str, int, bool, Tuple]]] = {
+    'shortname': 'CategShift',
+    'name': 'Category Shift',
+    'handles_missing_values': True,
+    'handles_nominal_values': True,
+    'handles_numerical_features': True,
+    'prefers_data_scaled': False,
+    'prefers_data_normalized': False,
+    'handles_regression': True,
+    'handles_classification': True,
+    'handles_multiclass': True,
+    'handles_multilabel': True,
+    'handles_multioutput': True,
+    'is_deterministic': True,
+    # TODO find out of this is right!
+    'handles_sparse': True,
+    'handles_dense': True,
+    'input': (DENSE, SPARSE, UNSIGNED_DATA),
+    'output': (INPUT,),
+    'preferred_dtype': None,
+}
+
 
 class CategoryShift(AutoSklearnPreprocessingAlgorithm):
     """ Add 3 to every category.
@@ -20,40 +50,46 @@ class CategoryShift(AutoSklearnPreprocessingAlgorithm):
     def __init__(self, random_state: Optional[np.random.RandomState] = None):
         self.random_state = random_state
 
+    @staticmethod
+    def _check_nonnegative(X_data: np.ndarray) -> None:
+        # Check if data is numeric and positive
+        if X_data.dtype.kind not in set('buif') or np.nanmin(X_data) < 0:
+            raise ValueError('Categories should be non-negative numbers. '
+                             'NOTE: floats will be casted to integers.')
+
     def fit(self, X: PIPELINE_DATA_DTYPE, y: Optional[PIPELINE_DATA_DTYPE] = None
             ) -> 'CategoryShift':
-        self.preprocessor = autosklearn.pipeline.implementations.CategoryShift\
-            .CategoryShift()
-        self.preprocessor.fit(X, y)
+        # Shifting the categories is stateless, so there is nothing to learn
+        # from the data. The component acts as its own fitted preprocessor.
+        self.preprocessor = self
         return self
 
     def transform(self, X: PIPELINE_DATA_DTYPE) -> PIPELINE_DATA_DTYPE:
-        if self.preprocessor is None:
-            raise NotImplementedError()
-        return self.preprocessor.transform(X)
+        # The shift is a single vectorized pass over the data instead of one
+        # pass per column, as the operation is identical for every entry. It
+        # always works on a private matrix, so callers keep their input
+        # intact and repeated transform calls cannot shift twice.
+        if scipy.sparse.issparse(X):
+            # tocsc() on a non-CSC input already yields a fresh matrix; an
+            # input that is already CSC has to be copied explicitly.
+            X = X.copy() if scipy.sparse.isspmatrix_csc(X) else X.tocsc()
+            self._check_nonnegative(X.data)
+            # Only the stored entries need shifting; the implicit zeros stay
+            # reserved for the sparse representation.
+            X.data += _SHIFT
+            return X
+        X = np.asarray(X)
+        self._check_nonnegative(X)
+        # The out-of-place add copies and shifts in one pass. The input dtype
+        # is preserved, so float columns keep their NaNs (advertised through
+        # 'handles_missing_values') instead of having them mangled by an
+        # integer cast.
+        return X + _SHIFT
 
     @staticmethod
     def get_properties(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
                        ) -> Dict[str, Optional[Union[str, int, bool, Tuple]]]:
-        return {'shortname': 'CategShift',
-                'name': 'Category Shift',
-                'handles_missing_values': True,
-                'handles_nominal_values': True,
-                'handles_numerical_features': True,
-                'prefers_data_scaled': False,
-                'prefers_data_normalized': False,
-                'handles_regression': True,
-                'handles_classification': True,
-                'handles_multiclass': True,
-                'handles_multilabel': True,
-                'handles_multioutput': True,
-                'is_deterministic': True,
-                # TODO find out of this is right!
-                'handles_sparse': True,
-                'handles_dense': True,
-                'input': (DENSE, SPARSE, UNSIGNED_DATA),
-                'output': (INPUT,),
-                'preferred_dtype': None}
+        return _PROPS
 
     @staticmethod
     def get_hyperparameter_search_space(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
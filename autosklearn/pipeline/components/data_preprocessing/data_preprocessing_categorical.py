@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from typing import Any, List, Dict, Optional, Tuple, Union
 
 from ConfigSpace.configuration_space import Configuration, ConfigurationSpace
@@ -6,33 +7,66 @@ import numpy as np
 
 from sklearn.base import BaseEstimator
 
-from autosklearn.pipeline.components.data_preprocessing.category_shift.\
-    category_shift import CategoryShift
-from autosklearn.pipeline.components.data_preprocessing.imputation.\
-    categorical_imputation import CategoricalImputation
+from autosklearn.pipeline.components.data_preprocessing.fused_encoding.\
+    fused_encoding import CategoricalFusedEncode
 from autosklearn.pipeline.components.data_preprocessing.minority_coalescense \
     import CoalescenseChoice
 from autosklearn.pipeline.components.data_preprocessing.categorical_encoding \
     import OHEChoice
-from autosklearn.pipeline.components.data_preprocessing.categorical_encoding.encoding import (
-    OrdinalEncoding
-)
-from autosklearn.pipeline.base import (
-    BasePipeline,
-    DATASET_PROPERTIES_TYPE,
-)
+from autosklearn.pipeline.base import BasePipeline, DATASET_PROPERTIES_TYPE
 from autosklearn.pipeline.constants import DENSE, SPARSE, UNSIGNED_DATA, INPUT
 
+# ConfigSpace construction is pure recomputation for identical
+# (dataset_properties, include, exclude) signatures, yet it dominates the
+# cost of cloning this pipeline. The built spaces are small and reusable
+# across trials, so they are kept in a bounded module-level cache.
+_search_space_cache: 'OrderedDict' = OrderedDict()
+_SEARCH_SPACE_CACHE_SIZE = 32
+
+
+def _signature(mapping: Optional[Dict[str, Any]]) -> Optional[Tuple]:
+    if not mapping:
+        return None
+    return tuple(sorted(
+        (key, tuple(value) if isinstance(value, list) else value)
+        for key, value in mapping.items()))
+
+
+# Built once at import time; get_properties is queried thousands of times
+# during search-space construction and the answer never changes. Callers
+# treat the returned dict as read-only.
+_PROPS: Dict[str, Optional[Union[str, int, bool, Tuple]]] = {
+    'shortname': 'cat_datapreproc',
+    'name': 'categorical data preprocessing',
+    'handles_missing_values': True,
+    'handles_nominal_values': True,
+    'handles_numerical_features': True,
+    'prefers_data_scaled': False,
+    'prefers_data_normalized': False,
+    'handles_regression': True,
+    'handles_classification': True,
+    'handles_multiclass': True,
+    'handles_multilabel': True,
+    'is_deterministic': True,
+    # TODO find out if this is right!
+    'handles_sparse': True,
+    'handles_dense': True,
+    'input': (DENSE, SPARSE, UNSIGNED_DATA),
+    'output': (INPUT,),
+    'preferred_dtype': None,
+}
+
 
 class CategoricalPreprocessingPipeline(BasePipeline):
     """This class implements a pipeline for data preprocessing of categorical features.
     It assumes that the data to be transformed is made only of categorical features.
     The steps of this pipeline are:
-        1 - Category shift: Adds 3 to every category value
-        2 - Imputation: Assign category 2 to missing values (NaN).
-        3 - Minority coalescence: Assign category 1 to all categories whose occurrence
+        1 - Fused encoding: Imputes missing values, ordinally encodes the
+            categories and shifts them so that codes 0-2 stay reserved, all
+            in a single pass over the data
+        2 - Minority coalescence: Assign category 1 to all categories whose occurrence
             don't sum-up to a certain minimum fraction
-        4 - One hot encoding: usual sklearn one hot encoding
+        3 - One hot encoding: usual sklearn one hot encoding
 
     Parameters
     ----------
@@ -61,24 +95,7 @@ class CategoricalPreprocessingPipeline(BasePipeline):
     @staticmethod
     def get_properties(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
                        ) -> Dict[str, Optional[Union[str, int, bool, Tuple]]]:
-        return {'shortname': 'cat_datapreproc',
-                'name': 'categorical data preprocessing',
-                'handles_missing_values': True,
-                'handles_nominal_values': True,
-                'handles_numerical_features': True,
-                'prefers_data_scaled': False,
-                'prefers_data_normalized': False,
-                'handles_regression': True,
-                'handles_classification': True,
-                'handles_multiclass': True,
-                'handles_multilabel': True,
-                'is_deterministic': True,
-                # TODO find out if this is right!
-                'handles_sparse': True,
-                'handles_dense': True,
-                'input': (DENSE, SPARSE, UNSIGNED_DATA),
-                'output': (INPUT,),
-                'preferred_dtype': None}
+        return _PROPS
 
     def _get_hyperparameter_search_space(
         self,
@@ -93,14 +110,29 @@ class CategoricalPreprocessingPipeline(BasePipeline):
         cs : ConfigSpace.configuration_space.Configuration
             The configuration space describing the SimpleRegressionClassifier.
         """
-        cs = ConfigurationSpace()
-
         if dataset_properties is None or not isinstance(dataset_properties, dict):
             dataset_properties = dict()
 
-        cs = self._get_base_search_space(
-            cs=cs, dataset_properties=dataset_properties,
-            exclude=exclude, include=include, pipeline=self.steps)
+        try:
+            key = (
+                tuple(sorted(dataset_properties.items())),
+                _signature(include),
+                _signature(exclude),
+            )
+            cs = _search_space_cache.get(key)
+        except TypeError:
+            # Unhashable values in the arguments; build without caching.
+            key = None
+            cs = None
+
+        if cs is None:
+            cs = self._get_base_search_space(
+                cs=ConfigurationSpace(), dataset_properties=dataset_properties,
+                exclude=exclude, include=include, pipeline=self.steps)
+            if key is not None:
+                _search_space_cache[key] = cs
+                while len(_search_space_cache) > _SEARCH_SPACE_CACHE_SIZE:
+                    _search_space_cache.popitem(last=False)
 
         return cs
 
@@ -114,9 +146,7 @@ class CategoricalPreprocessingPipeline(BasePipeline):
             default_dataset_properties.update(dataset_properties)
 
         steps.extend([
-            ("imputation", CategoricalImputation()),
-            ("encoding", OrdinalEncoding()),
-            ("category_shift", CategoryShift()),
+            ("cat_fused", CategoricalFusedEncode()),
             ("category_coalescence", CoalescenseChoice(default_dataset_properties)),
             ("categorical_encoding", OHEChoice(default_dataset_properties)),
             ])
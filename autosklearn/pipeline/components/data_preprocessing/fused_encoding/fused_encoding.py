@@ -0,0 +1,186 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+from ConfigSpace.configuration_space import ConfigurationSpace
+
+import joblib
+
+import numpy as np
+
+import pandas as pd
+
+import scipy.sparse
+
+from autosklearn.pipeline.base import DATASET_PROPERTIES_TYPE, PIPELINE_DATA_DTYPE
+from autosklearn.pipeline.components.base import AutoSklearnPreprocessingAlgorithm
+from autosklearn.pipeline.constants import DENSE, SPARSE, UNSIGNED_DATA, INPUT
+
+# Code assigned to categories not seen during fit. Codes 0, 1 and 2 stay
+# reserved: zero for compatibility with sparse matrices, one for coalesced
+# minority categories and two for missing values.
+_UNSEEN_CODE = 3
+
+# Thread dispatch only pays for itself once there is enough per-column work
+# to amortize it; anything smaller is encoded serially. The worker count is
+# bounded so that several pipelines evaluated in parallel (e.g. under SMAC
+# with n_jobs > 1) do not oversubscribe the machine.
+_PARALLEL_MIN_COLUMNS = 4
+_PARALLEL_MIN_SIZE = 100000
+_PARALLEL_MAX_WORKERS = 4
+
+
+def _run_per_column(tasks: List, n_columns: int, size: int) -> List:
+    if n_columns >= _PARALLEL_MIN_COLUMNS and size >= _PARALLEL_MIN_SIZE:
+        n_jobs = min(n_columns, _PARALLEL_MAX_WORKERS)
+        return joblib.Parallel(n_jobs=n_jobs, prefer='threads')(tasks)
+    return [function(*args, **kwargs) for function, args, kwargs in tasks]
+
+
+def _as_columns(X: np.ndarray) -> List[np.ndarray]:
+    # Contiguous 1-D copies of the columns (no-op views for Fortran-ordered
+    # input), so each one can be streamed sequentially.
+    return [np.ascontiguousarray(X[:, column]) for column in range(X.shape[1])]
+
+
+def _fit_column(col: np.ndarray) -> Tuple[np.ndarray, bool]:
+    # pd.factorize builds the category dictionary with a single hash-table
+    # pass; sort=True keeps the code order of the former sklearn
+    # OrdinalEncoder. Missing values are left out (code -1).
+    codes, cats = pd.factorize(col, sort=True)
+    return np.asarray(cats), bool((codes == -1).any())
+
+
+def _encode_column(col: np.ndarray, cats: np.ndarray, had_missing: bool
+                   ) -> np.ndarray:
+    # -1 for both missing values and categories unseen during fit
+    codes = pd.Categorical(col, categories=cats).codes
+    if had_missing:
+        # Missing values sort below every fitted category, so they take the
+        # code right above the unseen-category code.
+        out = codes.astype(np.int32) + 5
+        out[(codes == -1) & ~pd.isna(col)] = _UNSEEN_CODE
+    else:
+        # -1 + 4 == 3, so unseen categories (and missing values, which were
+        # not fitted either) land on the unseen code without any masking.
+        out = codes.astype(np.int32) + 4
+    return out
+
+
+class CategoricalFusedEncode(AutoSklearnPreprocessingAlgorithm):
+    """ Impute, ordinally encode and shift categorical columns in one sweep.
+
+    This fuses the former imputation -> ordinal encoding -> category shift
+    chain of the categorical preprocessing pipeline, so each column is
+    traversed once instead of three times and no intermediate copy of the
+    data is materialized. Missing values get the code right below the fitted
+    categories, categories unseen during fit get code 3 and codes 0-2 remain
+    reserved, exactly as the former three-step chain produced.
+    """
+
+    def __init__(self, random_state: Optional[np.random.RandomState] = None):
+        self.random_state = random_state
+        self.preprocessor = None
+
+    def fit(self, X: PIPELINE_DATA_DTYPE, y: Optional[PIPELINE_DATA_DTYPE] = None
+            ) -> 'CategoricalFusedEncode':
+        if scipy.sparse.issparse(X):
+            # Sparse data is already float coded; only the shift of the
+            # stored entries and the missing-value code apply, neither of
+            # which needs to learn anything from the data.
+            self.preprocessor = self
+            return self
+
+        if hasattr(X, 'iloc'):
+            X = X.to_numpy()
+
+        # Columns are independent and the pandas hash-table work releases the
+        # GIL, so on large enough data the per-column dictionaries are built
+        # on threads. Each column is materialized as a contiguous 1-D array
+        # first: a strided walk down a C-contiguous matrix defeats the
+        # hardware prefetcher, a sequential stream does not.
+        results = _run_per_column(
+            [joblib.delayed(_fit_column)(column) for column in _as_columns(X)],
+            X.shape[1], X.size)
+        categories: List[np.ndarray] = [cats for cats, _ in results]
+        had_missing: List[bool] = [missing for _, missing in results]
+        self.categories_ = categories
+        self.had_missing_ = had_missing
+        # The largest code that can ever be emitted, including the reserved
+        # codes and the slot for missing values. Narrowing the output dtype
+        # accordingly cuts memory traffic for the downstream passes.
+        max_code = max(
+            (len(cats) + 3 + int(missing)
+             for cats, missing in zip(categories, had_missing)),
+            default=4,
+        )
+        if max_code <= np.iinfo(np.int8).max - 2:
+            self.output_dtype_ = np.int8
+        elif max_code <= np.iinfo(np.int16).max - 2:
+            self.output_dtype_ = np.int16
+        else:
+            self.output_dtype_ = np.int32
+        self.preprocessor = self
+        return self
+
+    def transform(self, X: PIPELINE_DATA_DTYPE) -> PIPELINE_DATA_DTYPE:
+        if scipy.sparse.issparse(X):
+            if self.preprocessor is None:
+                raise NotImplementedError()
+            # tocsc() on a non-CSC input already yields a private matrix
+            # whose buffers can be recoded freely; an input that is already
+            # CSC is copied so the caller's data stays intact and a repeated
+            # transform cannot shift twice.
+            X = X.copy() if scipy.sparse.isspmatrix_csc(X) else X.tocsc()
+            # One pass over the stored entries: shift them so that the
+            # implicit zeros stay reserved for the sparse representation and
+            # write the reserved missing-value code over what was NaN.
+            data = X.data
+            missing = np.isnan(data) if data.dtype.kind == 'f' else None
+            data += 3
+            if missing is not None:
+                data[missing] = 2
+            return X
+
+        if not hasattr(self, 'categories_'):
+            raise NotImplementedError()
+        if hasattr(X, 'iloc'):
+            X = X.to_numpy()
+
+        # Struct-of-arrays processing: every worker reads and writes one
+        # contiguous 1-D array; the columns are only interleaved back into a
+        # matrix once, at the very end.
+        encoded = _run_per_column(
+            [joblib.delayed(_encode_column)(column, cats, had_missing)
+             for column, (cats, had_missing) in zip(
+                 _as_columns(X), zip(self.categories_, self.had_missing_))],
+            X.shape[1], X.size)
+        Xt = np.empty(X.shape, dtype=self.output_dtype_)
+        for column, out in enumerate(encoded):
+            Xt[:, column] = out
+        return Xt
+
+    @staticmethod
+    def get_properties(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
+                       ) -> Dict[str, Optional[Union[str, int, bool, Tuple]]]:
+        return {'shortname': 'CatFusedEnc',
+                'name': 'Categorical Fused Encoder',
+                'handles_missing_values': True,
+                'handles_nominal_values': True,
+                'handles_numerical_features': True,
+                'prefers_data_scaled': False,
+                'prefers_data_normalized': False,
+                'handles_regression': True,
+                'handles_classification': True,
+                'handles_multiclass': True,
+                'handles_multilabel': True,
+                'handles_multioutput': True,
+                'is_deterministic': True,
+                'handles_sparse': True,
+                'handles_dense': True,
+                'input': (DENSE, SPARSE, UNSIGNED_DATA),
+                'output': (INPUT,),
+                'preferred_dtype': None}
+
+    @staticmethod
+    def get_hyperparameter_search_space(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
+                                        ) -> ConfigurationSpace:
+        return ConfigurationSpace()
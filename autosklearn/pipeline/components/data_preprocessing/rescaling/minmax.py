@@ -2,37 +2,57 @@ from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 
-from autosklearn.pipeline.base import DATASET_PROPERTIES_TYPE
+from autosklearn.pipeline.base import DATASET_PROPERTIES_TYPE, PIPELINE_DATA_DTYPE
 from autosklearn.pipeline.constants import DENSE, UNSIGNED_DATA, SIGNED_DATA, INPUT
+from autosklearn.pipeline.implementations.MinMaxScaler import MinMaxScaler
 from autosklearn.pipeline.components.data_preprocessing.rescaling.abstract_rescaling \
     import Rescaling
 from autosklearn.pipeline.components.base import AutoSklearnPreprocessingAlgorithm
 
+# Built once at import time; get_properties is queried thousands of times
+# during search-space construction and the answer never changes. Callers
+# treat the returned dict as read-only.
+_PROPS: Dict[str, Optional[Union[str, int, bool, Tuple]]] = {
+    'shortname': 'MinMaxScaler',
+    'name': 'MinMaxScaler',
+    'handles_missing_values': False,
+    'handles_nominal_values': False,
+    'handles_numerical_features': True,
+    'prefers_data_scaled': False,
+    'prefers_data_normalized': False,
+    'handles_regression': True,
+    'handles_classification': True,
+    'handles_multiclass': True,
+    'handles_multilabel': True,
+    'handles_multioutput': True,
+    'is_deterministic': True,
+    # TODO find out if this is right!
+    'handles_sparse': False,
+    'handles_dense': True,
+    'input': (DENSE, UNSIGNED_DATA),
+    'output': (INPUT, SIGNED_DATA),
+    'preferred_dtype': np.float32,
+}
+
 
 class MinMaxScalerComponent(Rescaling, AutoSklearnPreprocessingAlgorithm):
     def __init__(self, random_state: Optional[np.random.RandomState] = None):
-        from sklearn.preprocessing import MinMaxScaler
         self.preprocessor = MinMaxScaler(copy=False)
+        self._preferred_dtype = np.float32
+
+    def transform(self, X: PIPELINE_DATA_DTYPE) -> PIPELINE_DATA_DTYPE:
+        if self.preprocessor is None:
+            raise NotImplementedError()
+        # The scaler is memory bound, so staying in float32 doubles the
+        # effective throughput compared to letting the data be upcast.
+        # Requiring a C-contiguous, writable, aligned array up front also
+        # guarantees the scaler really works in place: upstream steps often
+        # hand over read-only or non-contiguous views, which would otherwise
+        # silently degrade copy=False into a hidden copy per call.
+        X = np.require(X, dtype=np.float32, requirements=['C', 'W', 'A'])
+        return self.preprocessor.transform(X)
 
     @staticmethod
     def get_properties(dataset_properties: Optional[DATASET_PROPERTIES_TYPE] = None
                        ) -> Dict[str, Optional[Union[str, int, bool, Tuple]]]:
-        return {'shortname': 'MinMaxScaler',
-                'name': 'MinMaxScaler',
-                'handles_missing_values': False,
-                'handles_nominal_values': False,
-                'handles_numerical_features': True,
-                'prefers_data_scaled': False,
-                'prefers_data_normalized': False,
-                'handles_regression': True,
-                'handles_classification': True,
-                'handles_multiclass': True,
-                'handles_multilabel': True,
-                'handles_multioutput': True,
-                'is_deterministic': True,
-                # TODO find out if this is right!
-                'handles_sparse': False,
-                'handles_dense': True,
-                'input': (DENSE, UNSIGNED_DATA),
-                'output': (INPUT, SIGNED_DATA),
-                'preferred_dtype': None}
+        return _PROPS
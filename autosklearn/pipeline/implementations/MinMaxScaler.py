@@ -0,0 +1,51 @@
+import numpy as np
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+
+
+class MinMaxScaler(BaseEstimator, TransformerMixin):
+    """ Scale each feature to a given range, in place.
+
+    Lean replacement for sklearn's MinMaxScaler on dense data: fit reduces
+    each column once with the nan-aware min/max reductions and transform
+    rescales the array in place with fused broadcast operations, without the
+    validation and dispatch layers of the sklearn implementation. float32
+    input is scaled natively instead of being upcast, halving the memory
+    traffic of this bandwidth-bound operation.
+    """
+
+    def __init__(self, feature_range=(0, 1), copy=True):
+        self.feature_range = feature_range
+        self.copy = copy
+
+    def fit(self, X, y=None):
+        if sparse.issparse(X):
+            raise TypeError("MinMaxScaler does not support sparse input.")
+        X = np.asarray(X)
+        data_min = np.nanmin(X, axis=0)
+        data_max = np.nanmax(X, axis=0)
+        data_range = data_max - data_min
+        self.data_min_ = data_min
+        self.data_max_ = data_max
+        self.data_range_ = data_range
+        # Division is many times slower than multiplication, so the
+        # reciprocal of the range is taken once per column here and transform
+        # only multiplies. Constant features must not divide by zero; like
+        # sklearn, they are mapped onto the lower bound of the feature range.
+        inv_range = 1.0 / np.where(data_range == 0, 1, data_range)
+        self.scale_ = (self.feature_range[1] - self.feature_range[0]) * inv_range
+        self.min_ = self.feature_range[0] - data_min * self.scale_
+        return self
+
+    def transform(self, X):
+        if sparse.issparse(X):
+            raise TypeError("MinMaxScaler does not support sparse input.")
+        X = np.asarray(X)
+        if X.dtype.kind != 'f':
+            X = X.astype(np.float64)
+        elif self.copy:
+            X = X.copy()
+        # Two fused broadcast operations, no division.
+        np.multiply(X, self.scale_, out=X)
+        np.add(X, self.min_, out=X)
+        return X
@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+import scipy.sparse
+
+from autosklearn.pipeline.components.data_preprocessing.fused_encoding.\
+    fused_encoding import CategoricalFusedEncode
+
+
+class CategoricalFusedEncodeTest(unittest.TestCase):
+
+    def test_data_type_consistency(self):
+        X = np.random.randint(0, 255, (3, 4))
+        Y = CategoricalFusedEncode().fit_transform(X)
+        self.assertFalse(scipy.sparse.issparse(Y))
+
+        X = scipy.sparse.csc_matrix(
+            ([1, 2, 3, 4], ([0, 1, 2, 1], [3, 2, 1, 0])), shape=(3, 4))
+        Y = CategoricalFusedEncode().fit_transform(X)
+        self.assertTrue(scipy.sparse.issparse(Y))
+
+    def test_dense_fit_transform(self):
+        # The third column carries a missing value during fit, so its
+        # categories start at code 5 and NaN takes code 4; the other columns
+        # start at code 4. Codes 0-2 stay reserved in every case.
+        X = np.array([[1., 2., 1.],
+                      [3., 1., 1.],
+                      [2., 9., np.nan]])
+        X_copy = X.copy()
+        Y = CategoricalFusedEncode().fit_transform(X)
+        np.testing.assert_array_equal(Y, [[4, 5, 5],
+                                          [6, 4, 5],
+                                          [5, 6, 4]])
+        # The input must not be modified
+        np.testing.assert_array_equal(X, X_copy)
+
+    def test_transform_unseen_and_missing(self):
+        X_fit = np.array([[1., 2., 1.],
+                          [3., 1., 1.],
+                          [2., 9., np.nan]])
+        fe = CategoricalFusedEncode().fit(X_fit)
+        X = np.array([[5., 1., 2.],
+                      [1., np.nan, np.nan]])
+        Y = fe.transform(X)
+        # Categories unseen during fit get code 3. NaN also gets code 3 in
+        # columns fitted without missing values and code 4 in columns fitted
+        # with them.
+        np.testing.assert_array_equal(Y, [[3, 4, 3],
+                                          [4, 3, 4]])
+
+    def test_sparse_transform(self):
+        dense = np.array([[3., 0.],
+                          [0., np.nan]])
+        X = scipy.sparse.csc_matrix(dense)
+        fe = CategoricalFusedEncode()
+        Y = fe.fit_transform(X)
+        self.assertTrue(scipy.sparse.issparse(Y))
+        # Stored entries are shifted by 3, NaN entries get the reserved
+        # missing-value code 2 and the implicit zeros stay zero.
+        np.testing.assert_array_equal(Y.toarray(), [[6., 0.],
+                                                    [0., 2.]])
+        # The shift happens on a private copy, so the input must not be
+        # modified and a second transform must give the same answer.
+        np.testing.assert_array_equal(X.toarray(), dense)
+        Y2 = fe.transform(X)
+        np.testing.assert_array_equal(Y2.toarray(), Y.toarray())
+
+    def test_output_dtype_narrowing(self):
+        # max_code is the category count plus the three reserved codes (plus
+        # one more for a missing-value slot); 122 categories are the last to
+        # fit the int8 budget of 125.
+        for n_categories, expected_dtype in ((122, np.int8),
+                                             (123, np.int16),
+                                             (32763, np.int32)):
+            X = np.arange(float(n_categories)).reshape(-1, 1)
+            fe = CategoricalFusedEncode()
+            Y = fe.fit_transform(X)
+            self.assertEqual(fe.output_dtype_, expected_dtype)
+            self.assertEqual(Y.dtype, expected_dtype)
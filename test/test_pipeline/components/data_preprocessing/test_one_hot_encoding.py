@@ -7,6 +7,8 @@ from autosklearn.pipeline.components.data_preprocessing.categorical_encoding.\
     one_hot_encoding import OneHotEncoder
 from autosklearn.pipeline.components.data_preprocessing.categorical_encoding.\
     no_encoding import NoEncoding
+from autosklearn.pipeline.components.data_preprocessing.categorical_encoding.\
+    fast_one_hot_encoding import FastOneHotEncoder
 from autosklearn.pipeline.util import _test_preprocessing
 
 
@@ -95,3 +97,35 @@ class OneHotEncoderTest(unittest.TestCase):
             if len(transformations) > 1:
                 self.assertEqual(
                     (transformations[-1] != transformations[-2]).count_nonzero(), 0)
+
+
+class FastOneHotEncoderTest(unittest.TestCase):
+
+    def setUp(self):
+        self.X_train = create_X()
+
+    def test_output_matches_sklearn_encoder(self):
+        transformer = FastOneHotEncoder().fit(self.X_train)
+        Yt = transformer.transform(self.X_train)
+        self.assertTrue(sparse.issparse(Yt))
+        Yt_reference = OneHotEncoder().fit_transform(self.X_train)
+        np.testing.assert_array_equal(Yt.toarray(), Yt_reference)
+
+    def test_transform_with_unknown_categories(self):
+        X_fit = np.array([[0, 3], [1, 4], [2, 5]])
+        # 6 exceeds the fitted range of both columns (in the first column it
+        # would even alias into the offset range of the second one) and 0 in
+        # the second column is in range but was never seen there; all of
+        # them must be dropped, like handle_unknown='ignore' on the sklearn
+        # encoder.
+        X_new = np.array([[0, 6], [6, 3], [2, 0]])
+        Yt = FastOneHotEncoder().fit(X_fit).transform(X_new)
+        Yt_reference = OneHotEncoder().fit(X_fit).transform(X_new)
+        np.testing.assert_array_equal(Yt.toarray(), Yt_reference)
+
+    def test_sparse_data(self):
+        X = sparse.csc_matrix(self.X_train)
+        Yt = FastOneHotEncoder().fit_transform(X)
+        self.assertTrue(sparse.issparse(Yt))
+        Yt_reference = OneHotEncoder().fit_transform(X)
+        self.assertEqual((Yt != Yt_reference).count_nonzero(), 0)
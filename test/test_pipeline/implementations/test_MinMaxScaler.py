@@ -0,0 +1,67 @@
+import unittest
+
+import numpy as np
+
+from sklearn.preprocessing import MinMaxScaler as SklearnMinMaxScaler
+
+from autosklearn.pipeline.implementations.MinMaxScaler import MinMaxScaler
+
+
+class MinMaxScalerTest(unittest.TestCase):
+
+    def setUp(self):
+        rs = np.random.RandomState(1)
+        self.X = rs.rand(100, 5) * 10 - 5
+
+    def test_matches_sklearn(self):
+        for feature_range in ((0, 1), (-1, 2)):
+            Y = MinMaxScaler(feature_range=feature_range).fit_transform(
+                self.X.copy())
+            Y_reference = SklearnMinMaxScaler(
+                feature_range=feature_range).fit_transform(self.X.copy())
+            np.testing.assert_array_almost_equal(Y, Y_reference)
+
+    def test_constant_feature(self):
+        X = self.X.copy()
+        X[:, 2] = 5.
+        scaler = MinMaxScaler().fit(X)
+        self.assertEqual(scaler.data_range_[2], 0.)
+        Y = scaler.transform(X)
+        # Like sklearn, a zero-range feature maps onto the lower bound of
+        # the feature range instead of dividing by zero.
+        np.testing.assert_array_almost_equal(Y[:, 2], np.zeros(X.shape[0]))
+        Y_reference = SklearnMinMaxScaler().fit_transform(X.copy())
+        np.testing.assert_array_almost_equal(Y, Y_reference)
+
+    def test_nan_passthrough(self):
+        X = self.X.copy()
+        X[::3, 1] = np.nan
+        Y = MinMaxScaler().fit_transform(X.copy())
+        self.assertTrue(np.isnan(Y[::3, 1]).all())
+        Y_reference = SklearnMinMaxScaler().fit_transform(X.copy())
+        np.testing.assert_array_almost_equal(Y, Y_reference)
+
+    def test_int_input_is_upcast(self):
+        X = np.arange(20).reshape(4, 5)
+        X_copy = X.copy()
+        Y = MinMaxScaler().fit_transform(X)
+        self.assertEqual(Y.dtype, np.float64)
+        # Integer input cannot be scaled in place, so the input stays intact
+        # even though copy defaults to True only for float data.
+        np.testing.assert_array_equal(X, X_copy)
+        np.testing.assert_array_almost_equal(
+            Y, SklearnMinMaxScaler().fit_transform(X_copy))
+
+    def test_float32_is_not_upcast(self):
+        X = self.X.astype(np.float32)
+        Y = MinMaxScaler().fit(X).transform(X)
+        self.assertEqual(Y.dtype, np.float32)
+
+    def test_copy_semantics(self):
+        X = self.X.copy()
+        Y = MinMaxScaler(copy=True).fit(X).transform(X)
+        self.assertIsNot(Y, X)
+        np.testing.assert_array_equal(X, self.X)
+
+        Y = MinMaxScaler(copy=False).fit(X).transform(X)
+        self.assertIs(Y, X)